@@ -3,16 +3,9 @@
 # For the full list of built-in configuration values, see the documentation:
 # https://www.sphinx-doc.org/en/master/usage/configuration.html
 
-import sys
-import os
-import tomllib
-
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath('..'))
-
-# Read version from pyproject.toml
-with open('../pyproject.toml', 'rb') as f:
-    pyproject = tomllib.load(f)
+# Imported as a module so no bare `version` name lands in the conf namespace,
+# where Sphinx would pick it up as the short-version config value.
+import importlib.metadata
 
 # -- Project information -----------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#project-information
@@ -20,23 +13,40 @@ with open('../pyproject.toml', 'rb') as f:
 project = 'astro-math'
 copyright = '2025, astro-math contributors'
 author = 'astro-math contributors'
-release = pyproject['project']['version']
+
+# The package is installed for docs builds (RTD runs maturin develop), so the
+# version comes from its metadata rather than re-parsing pyproject.toml.
+try:
+    release = importlib.metadata.version('astro-math')
+except importlib.metadata.PackageNotFoundError:
+    release = '0.0.0.dev0'
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
 
+# AutoAPI parses the sources statically, so autodoc/autosummary (which would
+# import every module, including the compiled extension) are not needed.
 extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.autosummary',
+    'autoapi.extension',
     'sphinx.ext.viewcode',
     'sphinx.ext.napoleon',
     'sphinx.ext.intersphinx',
-    'autoapi.extension',
+    'sphinx_remove_toctrees',
 ]
 
+# The RTD theme re-renders the full toctree in every page's sidebar; keep the
+# per-symbol AutoAPI stubs out of it so pages don't pay for the whole API.
+# The stubs stay reachable through search and cross-references.
+remove_from_toctrees = ['api/astro_math/*']
+
 templates_path = ['_templates']
 exclude_patterns = ['_build', 'Thumbs.db', '.DS_Store']
 
+# Don't let viewcode chase re-exports back to their defining module: for this
+# package that is the compiled astro_math.astro_math extension, which has no
+# Python source to render and would be imported and inspected for nothing.
+viewcode_follow_imported_members = False
+
 # -- Options for HTML output ------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#options-for-html-output
 
@@ -48,16 +58,18 @@ autoapi_type = 'python'
 autoapi_dirs = ['../python']
 autoapi_root = 'api'
 autoapi_add_toctree_entry = False
+# Document symbols only from their defining module; imported-members would
+# emit a second stub for every re-export, and special/undoc members add
+# per-symbol work without documenting anything useful here.
 autoapi_options = [
     'members',
-    'undoc-members', 
     'show-inheritance',
     'show-module-summary',
-    'special-members',
-    'imported-members',
 ]
 
 # AutoAPI settings
+autoapi_generate_api_docs = True
+autoapi_own_page_level = 'module'
 autoapi_python_class_content = 'both'
 autoapi_member_order = 'groupwise'
 autoapi_keep_files = True
@@ -82,12 +94,19 @@ napoleon_type_aliases = None
 napoleon_attr_annotations = True
 
 # -- Intersphinx mapping ----------------------------------------------------
+# Only inventories the docs actually cross-reference; nothing here links to
+# astropy, so its multi-MB inventory is not worth fetching.
 intersphinx_mapping = {
     'python': ('https://docs.python.org/3/', None),
     'numpy': ('https://numpy.org/doc/stable/', None),
-    'astropy': ('https://docs.astropy.org/en/stable/', None),
 }
 
-# -- Autosummary configuration ----------------------------------------------
-autosummary_generate = True
-autosummary_generate_overwrite = True
\ No newline at end of file
+# Reuse cached inventories for 90 days and don't let a slow mirror stall
+# cold builds.
+intersphinx_cache_limit = 90
+intersphinx_timeout = 5
+
+
+def setup(app):
+    # Everything configured here is static, so sphinx-build -j auto is safe.
+    return {'parallel_read_safe': True, 'parallel_write_safe': True}
@@ -36,7 +36,41 @@ Examples:
     >>> location = Location.parse("40°42'46\"N", "74°0'21.6\"W", 0.0)
 """
 
-# Import version info
-from astro_math.astro_math import __version__
+# Single source of truth for what the package exports; __all__ and the lazy
+# loader below are both derived from it.
+_EXPORTS = (
+    "__version__",
+    "aberration",
+    "airmass",
+    "galactic",
+    "location",
+    "nutation",
+    "precession",
+    "proper_motion",
+    "refraction",
+    "sidereal",
+    "sun_moon",
+    "time",
+    "timescales",
+    "transforms",
+)
 
-__all__ = ["__version__"]
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+# PEP 562: defer loading the compiled extension until an attribute is first
+# accessed, so `import astro_math` does not pay the PyO3 module-init cost.
+_LAZY = frozenset(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from astro_math import astro_math as _ext
+
+        value = getattr(_ext, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
\ No newline at end of file
@@ -1,4 +1,5 @@
-use numpy::{IntoPyArray, PyArray1};
+use numpy::datetime::{units, Datetime};
+use numpy::{IntoPyArray, PyArray1, PyReadonlyArray1};
 use pyo3::prelude::*;
 use pyo3::types::{PyDateTime, PyDateAccess, PyTimeAccess};
 use astro_math::time;
@@ -92,6 +93,55 @@ fn j2000_batch<'py>(
     Ok(days.into_pyarray_bound(py))
 }
 
+/// Batch convert a numpy datetime64[ns] array to Julian Dates.
+///
+/// Parameters
+/// ----------
+/// dt64_array : numpy.ndarray of datetime64[ns]
+///     UTC timestamps to convert (e.g. a FITS or pandas timestamp column)
+///
+/// Returns
+/// -------
+/// numpy.ndarray of float
+///     Julian Dates
+///
+/// Examples
+/// --------
+/// >>> from astro_math.time import julian_datetime64
+/// >>> import numpy as np
+/// >>> jds = julian_datetime64(np.array(['2000-01-01T12:00'], dtype='datetime64[ns]'))
+/// >>> print(f"{jds[0]:.1f}")
+/// 2451545.0
+#[pyfunction]
+#[pyo3(signature = (dt64_array))]
+fn julian_datetime64<'py>(
+    py: Python<'py>,
+    dt64_array: PyReadonlyArray1<'_, Datetime<units::Nanoseconds>>,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    let ns_slice = dt64_array.as_slice()?;
+    let mut jd_out = Vec::with_capacity(ns_slice.len());
+
+    // Use parallel processing for large arrays
+    if ns_slice.len() > 1000 {
+        use rayon::prelude::*;
+        let results: Vec<_> = ns_slice.par_iter()
+            .map(|&ns| jd_from_unix_ns(ns.into()))
+            .collect();
+        jd_out.extend(results);
+    } else {
+        for &ns in ns_slice {
+            jd_out.push(jd_from_unix_ns(ns.into()));
+        }
+    }
+
+    Ok(jd_out.into_pyarray_bound(py))
+}
+
+// datetime64[ns] counts nanoseconds from the Unix epoch, which is JD 2440587.5
+fn jd_from_unix_ns(ns: i64) -> f64 {
+    2440587.5 + ns as f64 / (86_400.0 * 1e9)
+}
+
 // Helper function to convert Python datetime to chrono DateTime
 fn datetime_from_py(dt: &Bound<'_, PyDateTime>) -> PyResult<DateTime<Utc>> {
     let year = dt.get_year();
@@ -111,6 +161,7 @@ fn datetime_from_py(dt: &Bound<'_, PyDateTime>) -> PyResult<DateTime<Utc>> {
 pub fn register(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(julian, m)?)?;
     m.add_function(wrap_pyfunction!(julian_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(julian_datetime64, m)?)?;
     m.add_function(wrap_pyfunction!(j2000, m)?)?;
     m.add_function(wrap_pyfunction!(j2000_batch, m)?)?;
     Ok(())
@@ -214,6 +265,27 @@ mod tests {
         }
     }
 
+    #[test]
+    fn test_jd_from_unix_ns_matches_julian_date() {
+        // The datetime64[ns] path must agree with the chrono-based conversion
+        let dates = vec![
+            Utc.with_ymd_and_hms(2000, 1, 1, 12, 0, 0).unwrap(),
+            Utc.with_ymd_and_hms(1970, 1, 1, 0, 0, 0).unwrap(),
+            Utc.with_ymd_and_hms(2024, 12, 31, 23, 59, 59).unwrap(),
+        ];
+
+        for dt in dates {
+            let ns = dt.timestamp_nanos_opt().unwrap();
+            let jd_ns = jd_from_unix_ns(ns);
+            let jd_chrono = time::julian_date(dt);
+            assert!(
+                (jd_ns - jd_chrono).abs() < 1e-9,
+                "datetime64 path should match julian_date: {} vs {}",
+                jd_ns, jd_chrono
+            );
+        }
+    }
+
     #[test]
     fn test_time_precision() {
         // Test that time precision is maintained (as done in datetime_from_py)
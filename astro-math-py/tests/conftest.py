@@ -0,0 +1,33 @@
+"""
+Shared fixtures for the astro-math binding tests.
+
+Session scope means fixed epochs and sample arrays are built once per run
+instead of once per test; the arrays are marked read-only so no test can
+mutate them for the others.
+"""
+
+import pytest
+import numpy as np
+from datetime import datetime
+
+
+@pytest.fixture(scope="session")
+def j2000_dt():
+    """The J2000.0 epoch as a datetime."""
+    return datetime(2000, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def j2000_jd():
+    """The J2000.0 epoch as a Julian Date."""
+    return 2451545.0
+
+
+@pytest.fixture(scope="session")
+def sample_radec():
+    """RA/Dec arrays spanning all four quadrants, for the batch APIs."""
+    ra = np.array([0.0, 90.0, 180.0, 270.0])
+    dec = np.array([0.0, 30.0, -30.0, 60.0])
+    ra.setflags(write=False)
+    dec.setflags(write=False)
+    return ra, dec
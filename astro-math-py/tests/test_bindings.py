@@ -5,27 +5,44 @@ These tests ensure the Python bindings are working correctly and provide
 code coverage for the PyO3 wrapper code.
 """
 
+import functools
+
 import pytest
 import astro_math
+import numpy as np
 from datetime import datetime
 import math
 
 
+@functools.lru_cache(maxsize=None)
+def julian(dt):
+    """Cached astro_math.time.julian so repeated epochs cross the FFI once."""
+    return astro_math.time.julian(dt)
+
+
 class TestJulianDate:
     """Test Julian Date conversions."""
 
-    def test_julian_date_j2000(self):
-        """Test J2000.0 epoch."""
-        dt = datetime(2000, 1, 1, 12, 0, 0)
-        jd = astro_math.time.julian(dt)
-        assert abs(jd - 2451545.0) < 0.001
+    @pytest.mark.parametrize(
+        "offset, expected",
+        [(0.0, 2451545.0), (2400000.5, 51544.5)],
+        ids=["jd", "mjd"],
+    )
+    def test_julian_date_j2000(self, j2000_dt, offset, expected):
+        """Test J2000.0 epoch as JD and as MJD (JD - 2400000.5)."""
+        jd = julian(j2000_dt)
+        assert abs(jd - offset - expected) < 0.001
+
+    def test_julian_datetime64(self, j2000_jd):
+        """Test batch conversion of a datetime64[ns] array."""
+        dt64 = np.array(
+            ["2000-01-01T12:00", "2024-01-01T00:00"], dtype="datetime64[ns]"
+        )
+
+        jds = astro_math.time.julian_datetime64(dt64)
 
-    def test_julian_date_mjd(self):
-        """Test Modified Julian Date."""
-        dt = datetime(2000, 1, 1, 12, 0, 0)
-        jd = astro_math.time.julian(dt)
-        mjd = jd - 2400000.5  # Calculate MJD from JD
-        assert abs(mjd - 51544.5) < 0.001
+        assert abs(jds[0] - j2000_jd) < 1e-6
+        assert abs(jds[1] - 2460310.5) < 1e-6
 
 
 class TestPrecession:
@@ -42,12 +59,9 @@ class TestPrecession:
         assert abs(ra_new - ra) > 0.001
         assert abs(dec_new - dec) < 0.1
 
-    def test_batch_precess(self):
+    def test_batch_precess(self, sample_radec):
         """Test batch precession."""
-        import numpy as np
-
-        ra_array = np.array([0.0, 90.0, 180.0, 270.0])
-        dec_array = np.array([0.0, 30.0, -30.0, 60.0])
+        ra_array, dec_array = sample_radec
         target = datetime(2024, 1, 1)
 
         ra_new, dec_new = astro_math.precession.batch_j2000_to_date(
@@ -61,19 +75,17 @@ class TestPrecession:
 class TestNutation:
     """Test nutation calculations."""
 
-    def test_nutation_values(self):
+    def test_nutation_values(self, j2000_jd):
         """Test nutation returns reasonable values."""
-        jd = 2451545.0  # J2000
-        dpsi, deps = astro_math.nutation.nutation(jd)
+        dpsi, deps = astro_math.nutation.nutation(j2000_jd)
 
         # Nutation should be small (< 20 arcsec typically)
         assert abs(dpsi) < 20.0
         assert abs(deps) < 20.0
 
-    def test_mean_obliquity(self):
+    def test_mean_obliquity(self, j2000_jd):
         """Test mean obliquity calculation."""
-        jd = 2451545.0  # J2000
-        eps = astro_math.nutation.mean_obliquity(jd)
+        eps = astro_math.nutation.mean_obliquity(j2000_jd)
 
         # Should be around 23.4 degrees
         assert 23.0 < eps < 24.0
@@ -97,8 +109,6 @@ class TestCoordinateTransforms:
 
     def test_batch_ra_dec_to_alt_az(self):
         """Test batch coordinate transformation."""
-        import numpy as np
-
         ra_array = np.array([0.0, 90.0, 180.0])
         dec_array = np.array([0.0, 30.0, -30.0])
         dt = datetime(2024, 1, 15, 22, 0, 0)
@@ -110,8 +120,8 @@ class TestCoordinateTransforms:
 
         assert len(alt_array) == len(ra_array)
         assert len(az_array) == len(ra_array)
-        assert all(-90 <= a <= 90 for a in alt_array)
-        assert all(0 <= a <= 360 for a in az_array)
+        assert np.all((alt_array >= -90) & (alt_array <= 90))
+        assert np.all((az_array >= 0) & (az_array <= 360))
 
 
 class TestGalacticCoordinates:
@@ -136,19 +146,16 @@ class TestGalacticCoordinates:
         assert abs(ra - 266.405) < 0.1
         assert abs(dec - (-28.936)) < 0.1
 
-    def test_batch_galactic(self):
+    def test_batch_galactic(self, sample_radec):
         """Test batch galactic conversions."""
-        import numpy as np
-
-        ra_array = np.array([0.0, 90.0, 180.0, 270.0])
-        dec_array = np.array([0.0, 30.0, -30.0, 60.0])
+        ra_array, dec_array = sample_radec
 
         l_array, b_array = astro_math.galactic.batch_equatorial_to_galactic(ra_array, dec_array)
 
         assert len(l_array) == len(ra_array)
         assert len(b_array) == len(dec_array)
-        assert all(0 <= l <= 360 for l in l_array)
-        assert all(-90 <= b <= 90 for b in b_array)
+        assert np.all((l_array >= 0) & (l_array <= 360))
+        assert np.all((b_array >= -90) & (b_array <= 90))
 
 
 class TestProperMotion:
@@ -177,7 +184,7 @@ class TestSiderealTime:
     def test_greenwich_sidereal_time(self):
         """Test Greenwich mean sidereal time."""
         dt = datetime(2024, 1, 1, 0, 0, 0)
-        jd = astro_math.time.julian(dt)
+        jd = julian(dt)
         gst = astro_math.sidereal.gmst(jd)
 
         # Should be between 0 and 24 hours
@@ -186,7 +193,7 @@ class TestSiderealTime:
     def test_local_sidereal_time(self):
         """Test local mean sidereal time."""
         dt = datetime(2024, 1, 1, 0, 0, 0)
-        jd = astro_math.time.julian(dt)
+        jd = julian(dt)
         longitude = -74.0060  # NYC
         lst = astro_math.sidereal.local_mean_sidereal_time(jd, longitude)
 
@@ -212,21 +219,18 @@ class TestAberration:
 class TestAirmass:
     """Test airmass calculations."""
 
-    def test_airmass_zenith(self):
-        """Test airmass at zenith."""
-        altitude = 90.0  # Zenith
-        airmass = astro_math.airmass.pickering(altitude)
-
-        # Should be 1.0 at zenith
-        assert abs(airmass - 1.0) < 0.001
-
-    def test_airmass_horizon(self):
-        """Test airmass near horizon."""
-        altitude = 5.0  # Near horizon
+    @pytest.mark.parametrize(
+        "altitude, lo, hi",
+        [
+            (90.0, 0.999, 1.001),  # ~1.0 at zenith
+            (5.0, 10.0, math.inf),  # large near horizon
+        ],
+        ids=["zenith", "horizon"],
+    )
+    def test_airmass(self, altitude, lo, hi):
+        """Test airmass at zenith and near the horizon."""
         airmass = astro_math.airmass.pickering(altitude)
-
-        # Should be large near horizon
-        assert airmass > 10.0
+        assert lo < airmass < hi
 
 
 class TestSunMoon:
@@ -254,27 +258,18 @@ class TestSunMoon:
 class TestRefraction:
     """Test atmospheric refraction."""
 
-    def test_refraction_zenith(self):
-        """Test refraction at zenith."""
-        altitude = 90.0
-        temperature = 10.0
-        pressure = 1013.25
-
+    @pytest.mark.parametrize(
+        "altitude, lo, hi",
+        [
+            (90.0, -0.001, 0.001),  # nearly zero at zenith
+            (0.0, 0.5, 0.7),  # ~0.57 degrees (34 arcminutes) at horizon
+        ],
+        ids=["zenith", "horizon"],
+    )
+    def test_refraction(self, altitude, lo, hi):
+        """Test refraction at zenith and at the horizon."""
         refraction = astro_math.refraction.bennett(altitude)
-
-        # Should be nearly zero at zenith
-        assert abs(refraction) < 0.001
-
-    def test_refraction_horizon(self):
-        """Test refraction at horizon."""
-        altitude = 0.0
-        temperature = 10.0
-        pressure = 1013.25
-
-        refraction = astro_math.refraction.bennett(altitude)
-
-        # Should be around 0.57 degrees (34 arcminutes) at horizon
-        assert 0.5 < refraction < 0.7
+        assert lo < refraction < hi
 
 
 if __name__ == "__main__":